@@ -12,6 +12,10 @@ Controls:
 - ESC: Quit
 """
 import sys
+import os
+import json
+from collections import deque
+from dataclasses import dataclass
 import math
 import random
 import asyncio
@@ -21,6 +25,81 @@ import pymunk
 import pymunk.pygame_util
 from pymunk import Vec2d
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Bound once: a plain global load per call instead of the
+# pygame.time.get_ticks attribute chain.
+_get_ticks = pygame.time.get_ticks
+
+_WAVE_IDS = {'sine': 0, 'square': 1, 'saw': 2, 'triangle': 3}
+
+# 4096-entry sine table indexed by the top 12 bits of the phase accumulator:
+# one float32 gather per sample instead of a transcendental call.
+_SINE_LUT = np.sin(np.linspace(0, 2 * np.pi, 4096, endpoint=False)).astype(np.float32)
+
+
+def _synth_kernel(inc, amplitude, attack_samples, decay_samples, wave_id, out):
+    """Fused oscillator + envelope loop writing int16 samples into ``out``.
+
+    One pass per sample: the 32-bit phase accumulator wraps once per period,
+    the envelope is the branch-free min of the attack ramp, decay ramp and
+    1.0, and the scaled result is stored directly — no temporary arrays.
+    """
+    n = out.shape[0]
+    phase = 0
+    for i in range(n):
+        if wave_id == 1:  # square
+            w = 1.0 if phase < (1 << 31) else -1.0
+        elif wave_id == 2:  # saw
+            w = phase * (2.0 / (1 << 32)) - 1.0
+        elif wave_id == 3:  # triangle
+            folded = phase if phase < (1 << 31) else 0xFFFFFFFF - phase
+            w = folded * (4.0 / (1 << 32)) - 1.0
+        else:  # sine
+            w = _SINE_LUT[phase >> 20]
+        env = 1.0
+        if attack_samples > 0 and i < attack_samples:
+            env = i / attack_samples
+        if decay_samples > 0 and n - i < decay_samples:
+            d = (n - i) / decay_samples
+            if d < env:
+                env = d
+        out[i] = int(w * env * amplitude)
+        phase = (phase + inc) & 0xFFFFFFFF
+
+
+if njit is not None:
+    _synth_kernel = njit(cache=True, fastmath=True)(_synth_kernel)
+else:
+    _synth_kernel = None
+
+
+def _step_particles(px, py, vx, vy, life):
+    """Advance live particles one frame, mutating the SoA arrays in place."""
+    for i in range(px.shape[0]):
+        if life[i] > 0:
+            px[i] += vx[i]
+            py[i] += vy[i]
+            vy[i] += 0.1
+            life[i] -= 1
+
+
+if njit is not None:
+    _step_particles = njit(cache=True, fastmath=True)(_step_particles)
+else:
+    _step_particles = None
+
+
+def _pack_stereo(audio):
+    """Duplicate a mono int16 signal into both channels of a raw stereo buffer."""
+    stereo = np.empty((audio.shape[0], 2), dtype=np.int16)
+    stereo[:, 0] = stereo[:, 1] = audio
+    return bytes(stereo)
+
 
 class SoundManager:
     def __init__(self):
@@ -47,32 +126,49 @@ class SoundManager:
     def _make_sound(self, frequency, duration, volume, attack, decay, wave='sine'):
         sample_rate = 44100
         n_samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, n_samples, dtype=np.float32)
-        
-        if wave == 'sine':
-            waveform = np.sin(2 * np.pi * frequency * t)
-        elif wave == 'square':
-            waveform = np.sign(np.sin(2 * np.pi * frequency * t))
-        elif wave == 'saw':
-            waveform = 2 * (t * frequency % 1) - 1
-        elif wave == 'triangle':
-            waveform = 2 * np.abs(2 * (t * frequency % 1) - 1) - 1
-        else:
-            waveform = np.sin(2 * np.pi * frequency * t)
-        
-        envelope = np.ones(n_samples, dtype=np.float32)
+
+        # DDS-style synthesis: a 32-bit integer phase accumulator wraps once
+        # per waveform period, so every wave shape falls out of bit twiddling
+        # on the phase instead of float modulo/transcendental pipelines.
+        inc = int(frequency / sample_rate * (1 << 32)) & 0xFFFFFFFF
         attack_samples = int(attack * sample_rate)
         decay_samples = int(decay * sample_rate)
-        
+
+        if _synth_kernel is not None:
+            # Numba path: oscillator and envelope fused into one compiled
+            # loop, no intermediate arrays at all.
+            audio = np.empty(n_samples, dtype=np.int16)
+            _synth_kernel(inc, volume * 32767, attack_samples, decay_samples,
+                          _WAVE_IDS.get(wave, 0), audio)
+            return pygame.mixer.Sound(buffer=_pack_stereo(audio))
+
+        phase = np.arange(n_samples, dtype=np.uint32) * np.uint32(inc)
+
+        if wave == 'square':
+            # Sign bit of the phase: first half-period high, second half low.
+            waveform = np.where(phase < (1 << 31), np.float32(1.0), np.float32(-1.0))
+        elif wave == 'saw':
+            # Phase ramps 0..2^32 each period; rescale to -1..1.
+            waveform = phase.astype(np.float32) * np.float32(2.0 / (1 << 32))
+            waveform -= np.float32(1.0)
+        elif wave == 'triangle':
+            # XOR-fold: reflect the second half-period back down.
+            folded = np.where(phase < (1 << 31), phase, ~phase)
+            waveform = folded.astype(np.float32) * np.float32(4.0 / (1 << 32))
+            waveform -= np.float32(1.0)
+        else:  # sine (default)
+            waveform = _SINE_LUT[phase >> np.uint32(20)]
+
+        # Envelope applied only on the attack/decay slices; the sustain
+        # portion is left untouched instead of multiplying by ones.
+        waveform *= volume * 32767
+
         if attack_samples > 0:
-            envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+            waveform[:attack_samples] *= np.linspace(0, 1, attack_samples, dtype=np.float32)
         if decay_samples > 0:
-            envelope[-decay_samples:] = np.linspace(1, 0, decay_samples)
-        
-        audio = (waveform * envelope * volume * 32767).astype(np.int16)
-        stereo = np.column_stack((audio, audio))
-        
-        return pygame.sndarray.make_sound(stereo)
+            waveform[-decay_samples:] *= np.linspace(1, 0, decay_samples, dtype=np.float32)
+
+        return pygame.mixer.Sound(buffer=_pack_stereo(waveform.astype(np.int16)))
     
     def play(self, sound_name):
         if self.enabled and sound_name in self.sounds:
@@ -89,6 +185,11 @@ SCREEN_WIDTH = 600
 SCREEN_HEIGHT = 800
 FPS = 60
 PHYSICS_SUBSTEPS = 5
+MAX_PARTICLES = 256
+# Slow frames only need 2 substeps for stability; the full 5 kick in above
+# this ball speed (px/s) to keep tunneling protection on fast shots.
+PHYSICS_MIN_SUBSTEPS = 2
+PHYSICS_FAST_BALL_SPEED = 500
 
 # Collision types
 COLLISION_BALL = 1
@@ -104,38 +205,43 @@ BALL_MASS = 1
 BALL_RADIUS = 12
 FLIPPER_MASS = 100
 BUMPER_RADIUS = 25
+MAX_BALLS = 8
 
 
 # =============================================================================
 # DIFFICULTY SETTINGS
 # =============================================================================
+@dataclass(frozen=True, slots=True)
 class DifficultyPreset:
-    """Difficulty preset with all tunable physics parameters."""
-    
-    def __init__(self, name: str, **kwargs):
-        self.name = name
-        # Gravity
-        self.gravity = kwargs.get('gravity', (0, 1000))
-        # Ball physics
-        self.ball_elasticity = kwargs.get('ball_elasticity', 0.7)
-        self.ball_friction = kwargs.get('ball_friction', 0.3)
-        # Flipper physics
-        self.flipper_elasticity = kwargs.get('flipper_elasticity', 0.4)
-        self.flipper_impulse = kwargs.get('flipper_impulse', 50000)
-        self.flipper_spring_stiffness = kwargs.get('flipper_spring_stiffness', 25000000)
-        self.flipper_spring_damping = kwargs.get('flipper_spring_damping', 1000000)
-        self.flipper_rest_angle = kwargs.get('flipper_rest_angle', 0.18)
-        # Bumper physics
-        self.bumper_elasticity = kwargs.get('bumper_elasticity', 1.5)
-        self.bumper_impulse = kwargs.get('bumper_impulse', 500)
-        # Plunger
-        self.plunger_max_power = kwargs.get('plunger_max_power', 2500)
-        self.plunger_charge_rate = kwargs.get('plunger_charge_rate', 5000)
-        # Game settings
-        self.starting_balls = kwargs.get('starting_balls', 3)
-        self.ball_saver_duration = kwargs.get('ball_saver_duration', 5.0)
-        # Scoring
-        self.score_multiplier = kwargs.get('score_multiplier', 1.0)
+    """Difficulty preset with all tunable physics parameters.
+
+    Frozen with __slots__ so the attribute reads collision handlers do on
+    the hot path resolve through C-level descriptors, not a __dict__.
+    """
+
+    name: str
+    # Gravity
+    gravity: tuple = (0, 1000)
+    # Ball physics
+    ball_elasticity: float = 0.7
+    ball_friction: float = 0.3
+    # Flipper physics
+    flipper_elasticity: float = 0.4
+    flipper_impulse: float = 50000
+    flipper_spring_stiffness: float = 25000000
+    flipper_spring_damping: float = 1000000
+    flipper_rest_angle: float = 0.18
+    # Bumper physics
+    bumper_elasticity: float = 1.5
+    bumper_impulse: float = 500
+    # Plunger
+    plunger_max_power: float = 2500
+    plunger_charge_rate: float = 5000
+    # Game settings
+    starting_balls: int = 3
+    ball_saver_duration: float = 5.0
+    # Scoring
+    score_multiplier: float = 1.0
 
 
 # Difficulty presets
@@ -271,24 +377,23 @@ class HighScoreBoard:
         self._load_scores()
     
     def _load_scores(self):
+        score_file = os.path.join(os.path.dirname(__file__), "highscores.json")
         try:
-            import json
-            import os
-            score_file = os.path.join(os.path.dirname(__file__), "highscores.json")
-            if os.path.exists(score_file):
-                with open(score_file, "r") as f:
-                    self.scores = json.load(f)
-        except:
+            # No exists() pre-check: just open and let a missing file raise,
+            # saving the extra stat syscall.
+            with open(score_file, "r") as f:
+                self.scores = json.load(f)
+        except FileNotFoundError:
             self.scores = []
-    
+        except Exception:
+            self.scores = []
+
     def _save_scores(self):
         try:
-            import json
-            import os
             score_file = os.path.join(os.path.dirname(__file__), "highscores.json")
             with open(score_file, "w") as f:
                 json.dump(self.scores, f)
-        except:
+        except Exception:
             pass
     
     def add_score(self, name: str, score: int):
@@ -307,17 +412,56 @@ class HighScoreBoard:
 # PINBALL TABLE CREATION
 # =============================================================================
 class PinballTable:
+    # Static wall geometry as (start, end, radius) — built once at class
+    # definition instead of appended segment by segment per table.
+    WALL_SEGMENTS = (
+        # Outer walls
+        ((50, 750), (30, 200), 3),
+        ((30, 200), (80, 50), 3),
+        ((80, 50), (520, 50), 3),
+        ((510, 100), (510, 750), 3),
+        ((560, 750), (560, 100), 3),
+        # Plunger lane entry curve
+        ((560, 100), (555, 80), 3),
+        ((555, 80), (545, 60), 3),
+        ((545, 60), (520, 50), 3),
+        # Left slingshot
+        ((50, 750), (100, 650), 3),
+        ((100, 650), (150, 620), 3),
+        # Right slingshot
+        ((450, 750), (400, 650), 3),
+        ((400, 650), (350, 620), 3),
+        ((60, 540), (160, 610), 3),
+        # Inner lane dividers
+        ((150, 150), (150, 250), 2),
+        ((350, 150), (350, 250), 2),
+        # Ramp guides
+        ((200, 300), (180, 400), 2),
+        ((300, 300), (320, 400), 2),
+    )
+
     def __init__(self, space: pymunk.Space, game_state: GameState, difficulty: DifficultyPreset, renderer=None, sound_manager=None):
         self.space = space
         self.game_state = game_state
         self.difficulty = difficulty
         self.renderer = renderer
         self.sound_manager = sound_manager
+        # Bound once so hot collision handlers call it unconditionally
+        # instead of re-testing self.sound_manager per contact.
+        self._play = sound_manager.play if sound_manager else (lambda _name: None)
         self.balls = []
         self.bumpers = []
         self.targets = []
         self.spinners = []
         self.ball_saver_segment = None
+        # Frame timestamp in seconds, refreshed by the main loop before each
+        # physics step so collision handlers don't hit SDL's timer per contact.
+        self.current_time = _get_ticks() * 0.001
+        # Scratch buffer for the vectorized off-screen check in update().
+        self._ball_pos = np.empty((MAX_BALLS, 2), dtype=np.float64)
+        # Particle spawns requested from inside pymunk's step; queued as
+        # (x, y, color, count) and drained by the renderer once per frame.
+        self._particle_queue = []
         
         self.left_flipper_body = None
         self.right_flipper_body = None
@@ -330,49 +474,56 @@ class PinballTable:
         self._create_targets()
         self._create_drain()
         self._setup_collision_handlers()
+        self._refresh_difficulty_cache()
+        if renderer:
+            renderer.attach_table(self)
+
+        # Flat (body, home_position) table so the per-frame kinematic reset
+        # is one tight loop instead of per-body code plus a spinner loop.
+        # Spinners are excluded: KINEMATIC bodies with zero linear velocity
+        # never drift, so re-pinning them every frame was pure overhead and
+        # pymunk integrates their angular_velocity on its own.
+        self._kinematic_resets = [
+            (self.right_flipper_body, (350, 700)),
+            (self.left_flipper_body, (150, 700)),
+            (self.mini_flipper_body, (450, 620)),
+        ]
+        # Flippers only drift off their pivots after a flip or a ball hit;
+        # the reset loop is skipped entirely while this flag is clear.
+        self._kinematic_dirty = True
     
+    def _refresh_difficulty_cache(self):
+        """Flatten hot difficulty-derived values onto the table.
+
+        Collision handlers run inside pymunk's C step, where chasing
+        self.difficulty.attr chains per contact is the dominant cost; cache
+        them as single attributes instead. Call again if difficulty changes
+        without rebuilding the table.
+        """
+        d = self.difficulty
+        self._bumper_score = int(100 * d.score_multiplier)
+        self._target_score = int(500 * d.score_multiplier)
+        self._bumper_impulse = d.bumper_impulse
+        self._flipper_boost = d.flipper_impulse * 0.015
+        # Flip impulses as plain tuples (Vec2d.unit() is (0, 1)); pymunk
+        # accepts tuples, so no Vec2d allocation per key press.
+        self._left_flip_impulse = (0.0, d.flipper_impulse)
+        self._right_flip_impulse = (0.0, -d.flipper_impulse)
+        self._mini_flip_impulse = (0.0, -d.flipper_impulse * 0.5)
+
     def _create_walls(self):
         """Create outer walls and playfield boundaries."""
         static_body = self.space.static_body
-        walls = []
-        
-        walls.append(pymunk.Segment(static_body, (50, 750), (30, 200), 3))
-        walls.append(pymunk.Segment(static_body, (30, 200), (80, 50), 3))
-        
-        walls.append(pymunk.Segment(static_body, (80, 50), (520, 50), 3))
-        
-        walls.append(pymunk.Segment(static_body, (510, 100), (510, 750), 3))
-        walls.append(pymunk.Segment(static_body, (560, 750), (560, 100), 3))
-        
-        walls.append(pymunk.Segment(static_body, (560, 100), (555, 80), 3))
-        walls.append(pymunk.Segment(static_body, (555, 80), (545, 60), 3))
-        walls.append(pymunk.Segment(static_body, (545, 60), (520, 50), 3))
-        
-        # Curved walls near flippers (slingshots area)
-        # Left slingshot
-        walls.append(pymunk.Segment(static_body, (50, 750), (100, 650), 3))
-        walls.append(pymunk.Segment(static_body, (100, 650), (150, 620), 3))
-        
-        # Right slingshot  
-        walls.append(pymunk.Segment(static_body, (450, 750), (400, 650), 3))
-        walls.append(pymunk.Segment(static_body, (400, 650), (350, 620), 3))
-        
-        walls.append(pymunk.Segment(static_body, (60, 540), (160, 610), 3))
-        
-        # Inner lane dividers
-        walls.append(pymunk.Segment(static_body, (150, 150), (150, 250), 2))
-        walls.append(pymunk.Segment(static_body, (350, 150), (350, 250), 2))
-        
-        # Ramp guides
-        walls.append(pymunk.Segment(static_body, (200, 300), (180, 400), 2))
-        walls.append(pymunk.Segment(static_body, (300, 300), (320, 400), 2))
-        
+        wall_filter = pymunk.ShapeFilter(group=1)
+        walls = [pymunk.Segment(static_body, a, b, radius)
+                 for a, b, radius in self.WALL_SEGMENTS]
+
         for wall in walls:
             wall.elasticity = 0.6
             wall.friction = 0.5
             wall.collision_type = COLLISION_WALL
-            wall.filter = pymunk.ShapeFilter(group=1)
-        
+            wall.filter = wall_filter
+
         self.space.add(*walls)
         self.walls = walls
     
@@ -429,6 +580,8 @@ class PinballTable:
         )
         self.space.add(left_pin, left_spring, left_limit)
         
+        right_flipper_shape._rkey = 0
+        left_flipper_shape._rkey = 1
         self.right_flipper_shape = right_flipper_shape
         self.left_flipper_shape = left_flipper_shape
         
@@ -457,6 +610,7 @@ class PinballTable:
             -0.1, 0.6
         )
         self.space.add(mini_pin, mini_spring, mini_limit)
+        mini_flipper_shape._rkey = 2
         self.mini_flipper_shape = mini_flipper_shape
     
     def _create_plunger_lane(self):
@@ -484,14 +638,20 @@ class PinballTable:
             (150, 520), (380, 540),
         ]
         
-        for pos in bumper_positions:
+        for index, pos in enumerate(bumper_positions):
             body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
             body.position = pos
             shape = pymunk.Circle(body, BUMPER_RADIUS)
             shape.elasticity = self.difficulty.bumper_elasticity
             shape.collision_type = COLLISION_BUMPER
+            shape._rkey = index
             self.space.add(body, shape)
             self.bumpers.append((body, shape))
+
+        # SoA mirror of bumper positions for the render pass; bumpers are
+        # KINEMATIC and never move, so computing this once replaces a
+        # body.position property read per bumper per frame.
+        self.bumper_positions = np.array(bumper_positions, dtype=np.float32)
     
     def _create_spinners(self):
         spinner_specs = [
@@ -522,12 +682,13 @@ class PinballTable:
             ((250, 120), (350, 120)),  # Top target
         ]
         
-        for start, end in target_positions:
+        for index, (start, end) in enumerate(target_positions):
             body = self.space.static_body
             shape = pymunk.Segment(body, start, end, 5)
             shape.elasticity = 0.8
             shape.collision_type = COLLISION_TARGET
             shape.sensor = False
+            shape._rkey = index
             self.space.add(shape)
             self.targets.append(shape)
     
@@ -582,75 +743,69 @@ class PinballTable:
         )
     
     def _on_spinner_hit(self, arbiter, space, data):
-        if self.sound_manager:
-            self.sound_manager.play('spinner')
+        self._play('spinner')
     
     def _on_wall_hit(self, arbiter, space, data):
-        if self.sound_manager:
-            self.sound_manager.play('wall')
+        self._play('wall')
     
     def _on_flipper_hit(self, arbiter, space, data):
         ball_shape = arbiter.shapes[0]
         flipper_shape = arbiter.shapes[1]
-        
-        if self.sound_manager:
-            self.sound_manager.play('flipper')
+        self._kinematic_dirty = True
+
+        self._play('flipper')
         
         flipper_vel = flipper_shape.body.angular_velocity
         if abs(flipper_vel) > 5:
-            boost = self.difficulty.flipper_impulse * 0.015
+            boost = self._flipper_boost
             ball_vel = ball_shape.body.velocity
             ball_shape.body.velocity = (ball_vel.x * 1.3, ball_vel.y - boost)
             
             if self.renderer:
                 contact = arbiter.contact_point_set.points[0].point_a
-                self.renderer.flipper_hit_times[id(flipper_shape)] = pygame.time.get_ticks() / 1000.0
-                self.renderer._spawn_particles(contact.x, contact.y, COLOR_NEON_CYAN, count=12)
+                self.renderer.flipper_hit_times[flipper_shape._rkey] = self.current_time
+                self._particle_queue.append((contact.x, contact.y, COLOR_NEON_CYAN, 12))
     
     def _on_bumper_hit(self, arbiter, space, data):
-        if self.sound_manager:
-            self.sound_manager.play('bumper')
-        
-        current_time = pygame.time.get_ticks() / 1000.0
-        d = self.difficulty
-        
+        self._play('bumper')
+
+        current_time = self.current_time
+
         if current_time - self.game_state.last_hit_time < 2.0:
             self.game_state.combo_multiplier = min(self.game_state.combo_multiplier + 1, 5)
         else:
             self.game_state.combo_multiplier = 1
-        
+
         self.game_state.last_hit_time = current_time
-        base_score = int(100 * d.score_multiplier)
-        self.game_state.score += base_score * self.game_state.combo_multiplier
-        
+        self.game_state.score += self._bumper_score * self.game_state.combo_multiplier
+
         ball_shape = arbiter.shapes[0]
         bumper_shape = arbiter.shapes[1]
-        direction = (ball_shape.body.position - bumper_shape.body.position).normalized()
-        ball_shape.body.apply_impulse_at_local_point(direction * d.bumper_impulse, (0, 0))
+        # Inline the kick direction instead of Vec2d subtraction/normalized(),
+        # which allocates three temporaries per hit.
+        bx, by = ball_shape.body.position
+        mx, my = bumper_shape.body.position
+        dx, dy = bx - mx, by - my
+        dist = math.hypot(dx, dy)
+        if dist > 0:
+            k = self._bumper_impulse / dist
+            ball_shape.body.apply_impulse_at_local_point((dx * k, dy * k), (0, 0))
         
         if self.renderer:
-            self.renderer.bumper_hit_times[id(bumper_shape)] = current_time
-            self.renderer._spawn_particles(bumper_shape.body.position.x, 
-                                          bumper_shape.body.position.y, 
-                                          COLOR_NEON_GREEN, 
-                                          count=15)
+            self.renderer.bumper_hit_times[bumper_shape._rkey] = current_time
+            self._particle_queue.append((mx, my, COLOR_NEON_GREEN, 15))
     
     def _on_target_hit(self, arbiter, space, data):
-        if self.sound_manager:
-            self.sound_manager.play('target')
+        self._play('target')
         
-        base_score = int(500 * self.difficulty.score_multiplier)
-        self.game_state.score += base_score * self.game_state.combo_multiplier
+        self.game_state.score += self._target_score * self.game_state.combo_multiplier
         
         if self.renderer:
             target_shape = arbiter.shapes[1]
-            current_time = pygame.time.get_ticks() / 1000.0
-            self.renderer.target_hit_times[id(target_shape)] = current_time
+            self.renderer.target_hit_times[target_shape._rkey] = self.current_time
             contact_point = arbiter.contact_point_set.points[0].point_a
-            self.renderer._spawn_particles(contact_point.x, 
-                                          contact_point.y, 
-                                          self.renderer.color_neon_blue, 
-                                          count=10)
+            self._particle_queue.append((contact_point.x, contact_point.y,
+                                         self.renderer.color_neon_blue, 10))
     
     def _on_drain(self, arbiter, space, data):
         """Handle ball drain."""
@@ -670,6 +825,9 @@ class PinballTable:
         moment = pymunk.moment_for_circle(BALL_MASS, 0, BALL_RADIUS)
         body = pymunk.Body(BALL_MASS, moment)
         body.position = position
+        # Render trail lives on the body itself: no id()-keyed dict in the
+        # renderer to hash into (or to leak entries once the ball drains).
+        body._trail = deque(maxlen=10)
         shape = pymunk.Circle(body, BALL_RADIUS)
         shape.elasticity = d.ball_elasticity
         shape.friction = d.ball_friction
@@ -687,44 +845,42 @@ class PinballTable:
         if self.balls and power > 0:
             ball = self.balls[-1]
             if self.is_ball_in_plunger_lane(ball):
-                if self.sound_manager:
-                    self.sound_manager.play('launch')
+                self._play('launch')
                 launch_velocity = -power * 2
                 self.plunger_body.velocity = (0, launch_velocity)
                 ball.body.velocity = (0, launch_velocity)
     
     def is_ball_in_plunger_lane(self, ball):
-        pos = ball.body.position
-        return pos.x > 505 and pos.x < 565 and pos.y > 600
+        x, y = ball.body.position
+        return 505 < x < 565 and y > 600
     
     def flip_left(self):
-        impulse = self.difficulty.flipper_impulse
+        self._kinematic_dirty = True
         self.left_flipper_body.apply_impulse_at_local_point(
-            Vec2d.unit() * impulse, (-60, 0)
+            self._left_flip_impulse, (-60, 0)
         )
-    
+
     def flip_right(self):
-        impulse = self.difficulty.flipper_impulse
+        self._kinematic_dirty = True
         self.right_flipper_body.apply_impulse_at_local_point(
-            Vec2d.unit() * -impulse, (-60, 0)
+            self._right_flip_impulse, (-60, 0)
         )
         self.mini_flipper_body.apply_impulse_at_local_point(
-            Vec2d.unit() * -impulse * 0.5, (-30, 0)
+            self._mini_flip_impulse, (-30, 0)
         )
     
     def update(self, dt):
         """Update table state."""
-        self.right_flipper_body.position = (350, 700)
-        self.left_flipper_body.position = (150, 700)
-        self.mini_flipper_body.position = (450, 620)
-        self.right_flipper_body.velocity = (0, 0)
-        self.left_flipper_body.velocity = (0, 0)
-        self.mini_flipper_body.velocity = (0, 0)
-        
-        for index, (spinner_body, _) in enumerate(self.spinners):
-            spinner_body.position = self.spinner_positions[index]
-            spinner_body.velocity = (0, 0)
-        
+        if self._kinematic_dirty:
+            drifted = False
+            for body, pos in self._kinematic_resets:
+                if tuple(body.position) != pos:
+                    body.position = pos
+                    drifted = True
+                body.velocity = (0, 0)
+            # Stay dirty until the bodies have settled back on their pivots.
+            self._kinematic_dirty = drifted
+
         if self.plunger_body.position.y < self.plunger_min_y:
             self.plunger_body.position = (535, self.plunger_rest_y)
             self.plunger_body.velocity = (0, 0)
@@ -734,12 +890,17 @@ class PinballTable:
             if self.game_state.ball_saver_timer <= 0:
                 self.game_state.ball_saver_active = False
         
-        # Remove balls that went off-screen (drained)
-        balls_to_remove = []
-        for ball in self.balls:
-            if ball.body.position.y > 800 or ball.body.position.x < -50:
-                balls_to_remove.append(ball)
-        
+        # Remove balls that went off-screen (drained): gather positions into
+        # the scratch array once, then test them all in a single vector op.
+        n = len(self.balls)
+        if n > self._ball_pos.shape[0]:
+            self._ball_pos = np.empty((n * 2, 2), dtype=np.float64)
+        for i, ball in enumerate(self.balls):
+            self._ball_pos[i] = ball.body.position
+        pos = self._ball_pos[:n]
+        drained = np.nonzero((pos[:, 1] > 800) | (pos[:, 0] < -50))[0]
+        balls_to_remove = [self.balls[i] for i in drained]
+
         for ball in balls_to_remove:
             self.space.remove(ball.body, ball)
             self.balls.remove(ball)
@@ -762,27 +923,207 @@ class Renderer:
         self.font = pygame.font.Font(None, 36)
         self.big_font = pygame.font.Font(None, 72)
         
-        self.ball_trails = {}
-        self.particles = []
-        self.bumper_hit_times = {}
-        self.target_hit_times = {}
-        self.flipper_hit_times = {}
+        # Fixed particle pool in structure-of-arrays layout: position,
+        # velocity, and life are NumPy arrays so the per-frame update is a
+        # handful of vector ops instead of per-particle Python arithmetic.
+        # Slots are reused via a free-index stack, so spawning/expiring
+        # particles never allocates.
+        self._p_x = np.zeros(MAX_PARTICLES, dtype=np.float32)
+        self._p_y = np.zeros(MAX_PARTICLES, dtype=np.float32)
+        self._p_vx = np.zeros(MAX_PARTICLES, dtype=np.float32)
+        self._p_vy = np.zeros(MAX_PARTICLES, dtype=np.float32)
+        self._p_life = np.zeros(MAX_PARTICLES, dtype=np.float32)
+        self._p_max_life = np.full(MAX_PARTICLES, 40, dtype=np.float32)
+        self._p_size = np.full(MAX_PARTICLES, 2, dtype=np.int32)
+        self._p_color = [COLOR_NEON_PINK] * MAX_PARTICLES
+        self._free_particles = list(range(MAX_PARTICLES))
+        # Flat hit-time arrays indexed by each shape's _rkey; sized in
+        # attach_table once the table's shapes exist.
+        self.bumper_hit_times = np.zeros(0, dtype=np.float32)
+        self.target_hit_times = np.zeros(0, dtype=np.float32)
+        self.flipper_hit_times = np.zeros(3, dtype=np.float32)
         self.combo_animation_scale = 1.0
         self.combo_animation_time = 0
-        
+
         self.color_neon_purple = (168, 85, 247)
         self.color_neon_blue = (59, 130, 246)
+
+        # Single reusable SRCALPHA scratch surface for all glow drawing.
+        # Helpers clear only their primitive's bounding box and blit that
+        # region back, instead of allocating a full-screen surface per
+        # glow layer per frame.
+        self._glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._screen_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        # Pre-baked composite sprites for the static glow auras: the
+        # concentric-circle stacks never change shape, so bake them once and
+        # blit instead of redrawing 4-5 alpha circles per primitive per frame.
+        self._bumper_glow = self._bake_bumper_sprite(hit=False)
+        self._bumper_hit_glow = self._bake_bumper_sprite(hit=True)
+        self._ball_glow = self._bake_ball_sprite()
+        # Targets vary in length; sprites are cached per (dx, dy, hit).
+        self._target_glow_cache = {}
+
+        # Rendered-text caches: SDL_ttf rasterization is one of the slowest
+        # pygame calls, so each label is re-rendered only when its value
+        # changes, keyed as (value, surface).
+        self._score_cache = (None, None)
+        self._balls_cache = (None, None)
+        self._diff_cache = (None, None)
+        self._hint_text = self.font.render("D: Change Difficulty", True, (100, 100, 100))
+        # Combo banner pre-rendered per (multiplier, enlarged) pair; the
+        # pulse animation just picks between the two sizes.
+        self._combo_cache = {}
+        # Fully composited game-over overlay, re-rendered only when its
+        # inputs (typed name, prompt state, shown scores) change; the
+        # blinking cursor is a separate tiny blit on top.
+        self._gameover_cache = (None, None, None)
+        self._cursor_text = None
+
+        # Static scenery (background fill + grid) baked once; draw() blits
+        # this instead of re-issuing ~55 line draws per frame.
+        self._grid_bg = self._build_static_background()
+
+        # Rotated flipper vertex offsets pre-computed for 256 quantized
+        # angle buckets per flipper, so the per-frame draw is a table lookup
+        # plus vertex translation instead of sin/cos and six multiplies.
+        self._flipper_polys = (
+            [(15, -10), (-80, 0), (15, 10)],   # right
+            [(-15, -10), (80, 0), (-15, 10)],  # left
+            [(8, -5), (-40, 0), (8, 5)],       # mini
+        )
+        self._flipper_rotations = []
+        for poly in self._flipper_polys:
+            table = []
+            for bucket in range(256):
+                a = bucket * (2 * math.pi / 256)
+                c, s = math.cos(a), math.sin(a)
+                table.append([(x * c - y * s, x * s + y * c) for x, y in poly])
+            self._flipper_rotations.append(table)
+
+        # Sprite blits are collected here and submitted in one batched call
+        # per draw helper instead of one Python->C crossing per blit.
+        # fblits is pygame-ce only; plain pygame falls back to blits().
+        self._blit_queue = []
+        self._fblits = getattr(self.screen, 'fblits', None)
     
     def set_difficulty(self, difficulty: DifficultyPreset):
         self.difficulty = difficulty
+
+    def _build_static_background(self) -> pygame.Surface:
+        """Render the immutable scenery into a reusable background surface."""
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        background.fill(COLOR_BG)
+
+        # Subtle cyberpunk grid
+        grid_color = (20, 20, 40)
+        for x in range(0, SCREEN_WIDTH, 40):
+            pygame.draw.line(background, grid_color, (x, 0), (x, SCREEN_HEIGHT), 1)
+        for y in range(0, SCREEN_HEIGHT, 40):
+            pygame.draw.line(background, grid_color, (0, y), (SCREEN_WIDTH, y), 1)
+
+        # Walls never move either: bake their neon glow and core lines here
+        # so the per-frame pipeline does zero wall work.
+        glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        for a, b, radius in PinballTable.WALL_SEGMENTS:
+            for i in range(3, 0, -1):
+                alpha = 50 - i * 10
+                pygame.draw.line(glow, (*self.color_neon_purple, alpha),
+                                 a, b, radius * 2 + i * 4)
+        background.blit(glow, (0, 0))
+        for a, b, radius in PinballTable.WALL_SEGMENTS:
+            pygame.draw.line(background, COLOR_WALL, a, b, radius)
+
+        # Plunger power-bar frame: only the fill level changes per frame.
+        pygame.draw.rect(background, COLOR_TEXT, (570, 650, 20, 100), 2)
+
+        return background
+
+    def _bake_bumper_sprite(self, hit: bool) -> pygame.Surface:
+        """Bake the full bumper visual (glow rings + core) into one sprite."""
+        size = int(BUMPER_RADIUS + 30) * 2
+        center = size // 2
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        core_color = (255, 255, 255) if hit else COLOR_NEON_GREEN
+        for i in range(5, 0, -1):
+            alpha = 30 - i * 5
+            pygame.draw.circle(sprite, (*COLOR_NEON_GREEN, alpha),
+                               (center, center), int(BUMPER_RADIUS + i * 6))
+        pygame.draw.circle(sprite, COLOR_NEON_GREEN, (center, center), int(BUMPER_RADIUS - 5), 3)
+        pygame.draw.circle(sprite, core_color, (center, center), int(BUMPER_RADIUS - 10))
+        return sprite
+
+    def _bake_ball_sprite(self) -> pygame.Surface:
+        """Bake the ball's glow halo, body, and highlight into one sprite."""
+        size = (BALL_RADIUS + 24) * 2
+        center = size // 2
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        for i in range(4, 0, -1):
+            alpha = 40 - i * 10
+            pygame.draw.circle(sprite, (*COLOR_NEON_PINK, alpha),
+                               (center, center), BALL_RADIUS + i * 6)
+        pygame.draw.circle(sprite, COLOR_NEON_PINK, (center, center), BALL_RADIUS)
+        pygame.draw.circle(sprite, (255, 150, 200), (center - 3, center - 3), 4)
+        return sprite
+
+    def _target_sprite(self, dx: int, dy: int, hit: bool) -> pygame.Surface:
+        """Return (and cache) the glow + core sprite for a target segment."""
+        key = (dx, dy, hit)
+        sprite = self._target_glow_cache.get(key)
+        if sprite is None:
+            pad = 10
+            sprite = pygame.Surface((abs(dx) + pad * 2, abs(dy) + pad * 2), pygame.SRCALPHA)
+            a = (pad + max(-dx, 0), pad + max(-dy, 0))
+            b = (a[0] + dx, a[1] + dy)
+            glow_alpha = 100 if hit else 50
+            core_color = (255, 255, 255) if hit else self.color_neon_blue
+            pygame.draw.line(sprite, (*self.color_neon_blue, glow_alpha), a, b, 15)
+            pygame.draw.line(sprite, core_color, a, b, 5)
+            self._target_glow_cache[key] = sprite
+        return sprite
+
+    def _flush_blits(self):
+        """Submit queued (sprite, dest) pairs in a single batched call."""
+        if self._blit_queue:
+            if self._fblits is not None:
+                self._fblits(self._blit_queue)
+            else:
+                self.screen.blits(self._blit_queue, doreturn=0)
+            self._blit_queue.clear()
+
+    def _glow_begin(self, left, top, width, height) -> pygame.Rect:
+        """Clear a bounding box on the shared glow surface for drawing.
+
+        Returns the box clamped to the screen; pass it to _glow_end after
+        drawing the glow primitives inside it.
+        """
+        rect = pygame.Rect(int(left), int(top), int(width), int(height)).clip(self._screen_rect)
+        if rect.width and rect.height:
+            self._glow_surface.fill((0, 0, 0, 0), rect)
+        return rect
+
+    def _glow_end(self, rect: pygame.Rect):
+        """Blit the finished glow region back onto the screen."""
+        if rect.width and rect.height:
+            self.screen.blit(self._glow_surface, rect.topleft, area=rect)
+
+    def attach_table(self, table: 'PinballTable'):
+        """Size the per-shape hit-time arrays for a freshly built table."""
+        self.bumper_hit_times = np.zeros(len(table.bumpers), dtype=np.float32)
+        self.target_hit_times = np.zeros(len(table.targets), dtype=np.float32)
+        self.flipper_hit_times = np.zeros(3, dtype=np.float32)
+        self._spinner_half_lens = [(shape.b.x - shape.a.x) / 2
+                                   for _, shape in table.spinners]
     
     def draw(self, table: PinballTable, game_state: GameState, high_score_board: 'HighScoreBoard' = None):
-        self.screen.fill(COLOR_BG)
-        
+        # One timestamp per frame: every animation helper reads self._now,
+        # so they all agree and none re-enters SDL's timer.
+        self._now = _get_ticks() * 0.001
+
+        self.screen.blit(self._grid_bg, (0, 0))
+
         self._update_animations(table, game_state)
-        
-        self._draw_cyberpunk_grid()
-        self._draw_walls(table)
+
         self._draw_bumpers(table)
         self._draw_spinners(table)
         self._draw_targets(table)
@@ -801,7 +1142,14 @@ class Renderer:
     
     def _update_animations(self, table: PinballTable, game_state: GameState):
         """Update animation states."""
-        current_time = pygame.time.get_ticks() / 1000.0
+        current_time = self._now
+
+        # Drain particle spawns queued by collision handlers during the
+        # physics step, batched here instead of per-contact renderer calls.
+        if table._particle_queue:
+            for x, y, color, count in table._particle_queue:
+                self._spawn_particles(x, y, color, count=count)
+            table._particle_queue.clear()
         
         if game_state.combo_multiplier > 1:
             time_since_hit = current_time - game_state.last_hit_time
@@ -811,88 +1159,58 @@ class Renderer:
                 self.combo_animation_scale = 1.0
         
         for ball in table.balls:
-            ball_id = id(ball.body)
-            if ball_id not in self.ball_trails:
-                self.ball_trails[ball_id] = []
-            self.ball_trails[ball_id].append(ball.body.position)
-            if len(self.ball_trails[ball_id]) > 10:
-                self.ball_trails[ball_id].pop(0)
+            ball.body._trail.append(ball.body.position)
         
-        self.particles = [p for p in self.particles if p['life'] > 0]
-        for particle in self.particles:
-            particle['life'] -= 1
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.1
-    
-    def _draw_cyberpunk_grid(self):
-        """Draw subtle background grid for cyberpunk atmosphere."""
-        grid_color = (20, 20, 40)
-        for x in range(0, SCREEN_WIDTH, 40):
-            pygame.draw.line(self.screen, grid_color, (x, 0), (x, SCREEN_HEIGHT), 1)
-        for y in range(0, SCREEN_HEIGHT, 40):
-            pygame.draw.line(self.screen, grid_color, (0, y), (SCREEN_WIDTH, y), 1)
-    
-    def _draw_walls(self, table: PinballTable):
-        """Draw walls with neon purple glow."""
-        for wall in table.walls:
-            start = (int(wall.a.x), int(wall.a.y))
-            end = (int(wall.b.x), int(wall.b.y))
-            width = int(wall.radius)
-            
-            for i in range(3, 0, -1):
-                alpha = 50 - i * 10
-                color = (*self.color_neon_purple, alpha)
-                glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                pygame.draw.line(glow_surface, color, start, end, width * 2 + i * 4)
-                self.screen.blit(glow_surface, (0, 0))
-            
-            pygame.draw.line(self.screen, COLOR_WALL, start, end, width)
+        alive = self._p_life > 0
+        if alive.any():
+            if _step_particles is not None:
+                _step_particles(self._p_x, self._p_y, self._p_vx,
+                                self._p_vy, self._p_life)
+            else:
+                self._p_x += self._p_vx
+                self._p_y += self._p_vy
+                self._p_vy += 0.1
+                self._p_life[alive] -= 1
+            expired = np.nonzero(alive & (self._p_life <= 0))[0]
+            if expired.size:
+                self._free_particles.extend(expired.tolist())
     
     def _draw_bumpers(self, table: PinballTable):
-        current_time = pygame.time.get_ticks() / 1000.0
+        current_time = self._now
         
-        for body, shape in table.bumpers:
-            pos = body.position
-            radius = shape.radius
-            
-            hit_time = self.bumper_hit_times.get(id(shape), 0)
-            time_since_hit = current_time - hit_time
-            
-            if time_since_hit < 0.2:
-                core_color = (255, 255, 255)
-                glow_color = COLOR_NEON_GREEN
-            else:
-                core_color = COLOR_NEON_GREEN
-                glow_color = COLOR_NEON_GREEN
-            
-            for i in range(5, 0, -1):
-                alpha = 30 - i * 5
-                glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surface, (*glow_color, alpha), (int(pos.x), int(pos.y)), int(radius + i * 6))
-                self.screen.blit(glow_surface, (0, 0))
-            
-            pygame.draw.circle(self.screen, glow_color, (int(pos.x), int(pos.y)), int(radius - 5), 3)
-            pygame.draw.circle(self.screen, core_color, (int(pos.x), int(pos.y)), int(radius - 10))
+        positions = table.bumper_positions
+        half = self._bumper_glow.get_width() // 2
+        for index, (body, shape) in enumerate(table.bumpers):
+            x = int(positions[index, 0])
+            y = int(positions[index, 1])
+
+            hit_time = self.bumper_hit_times[shape._rkey]
+            sprite = self._bumper_hit_glow if current_time - hit_time < 0.2 else self._bumper_glow
+            self._blit_queue.append((sprite, (x - half, y - half)))
+        self._flush_blits()
     
     def _draw_spinners(self, table: PinballTable):
         color_spinner = (255, 100, 50)
         
-        for body, shape in table.spinners:
+        for (body, shape), half_len in zip(table.spinners, self._spinner_half_lens):
             pos = body.position
             angle = body.angle
-            half_len = (shape.b.x - shape.a.x) / 2
-            
-            cos_a, sin_a = math.cos(angle), math.sin(angle)
+
+            # Quantized trig from the shared sine table (cosine is the same
+            # table a quarter turn ahead) — no libm calls per spinner.
+            bucket = int(angle * (4096 / (2 * math.pi))) & 4095
+            sin_a = _SINE_LUT[bucket]
+            cos_a = _SINE_LUT[(bucket + 1024) & 4095]
             start_x = pos.x - cos_a * half_len
             start_y = pos.y - sin_a * half_len
             end_x = pos.x + cos_a * half_len
             end_y = pos.y + sin_a * half_len
             
-            glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.line(glow_surface, (*color_spinner, 60), 
-                           (int(start_x), int(start_y)), (int(end_x), int(end_y)), 18)
-            self.screen.blit(glow_surface, (0, 0))
+            bbox = self._glow_begin(min(start_x, end_x) - 12, min(start_y, end_y) - 12,
+                                    abs(end_x - start_x) + 24, abs(end_y - start_y) + 24)
+            pygame.draw.line(self._glow_surface, (*color_spinner, 60),
+                             (int(start_x), int(start_y)), (int(end_x), int(end_y)), 18)
+            self._glow_end(bbox)
             
             pygame.draw.line(self.screen, color_spinner,
                            (int(start_x), int(start_y)), (int(end_x), int(end_y)), 8)
@@ -900,28 +1218,18 @@ class Renderer:
     
     def _draw_targets(self, table: PinballTable):
         """Draw targets with blue glow effect."""
-        current_time = pygame.time.get_ticks() / 1000.0
+        current_time = self._now
         
         for target in table.targets:
             start = (int(target.a.x), int(target.a.y))
             end = (int(target.b.x), int(target.b.y))
-            
-            hit_time = self.target_hit_times.get(id(target), 0)
-            time_since_hit = current_time - hit_time
-            
-            if time_since_hit < 0.3:
-                core_color = (255, 255, 255)
-                glow_alpha = 100
-            else:
-                core_color = self.color_neon_blue
-                glow_alpha = 50
-            
-            glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.line(glow_surface, (*self.color_neon_blue, glow_alpha), 
-                           start, end, 15)
-            self.screen.blit(glow_surface, (0, 0))
-            
-            pygame.draw.line(self.screen, core_color, start, end, 5)
+
+            hit_time = self.target_hit_times[target._rkey]
+            hit = current_time - hit_time < 0.3
+
+            sprite = self._target_sprite(end[0] - start[0], end[1] - start[1], hit)
+            self._blit_queue.append((sprite, (min(start[0], end[0]) - 10, min(start[1], end[1]) - 10)))
+        self._flush_blits()
     
     def _draw_plunger(self, table: PinballTable, game_state: GameState):
         """Draw plunger with yellow glow and power indicator."""
@@ -930,13 +1238,14 @@ class Renderer:
         plunger_width = 40
         plunger_height = 10
         
-        glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        bbox = self._glow_begin(plunger_x - plunger_width//2 - 9, plunger_y - plunger_height//2 - 6,
+                                plunger_width + 18, plunger_height + 12)
         for i in range(3, 0, -1):
             alpha = 40 - i * 12
-            pygame.draw.rect(glow_surface, (*COLOR_PLUNGER, alpha),
+            pygame.draw.rect(self._glow_surface, (*COLOR_PLUNGER, alpha),
                            (plunger_x - plunger_width//2 - i*3, plunger_y - plunger_height//2 - i*2,
                             plunger_width + i*6, plunger_height + i*4))
-        self.screen.blit(glow_surface, (0, 0))
+        self._glow_end(bbox)
         
         pygame.draw.rect(self.screen, COLOR_PLUNGER,
                         (plunger_x - plunger_width//2, plunger_y - plunger_height//2,
@@ -948,37 +1257,31 @@ class Renderer:
         bar_height = int(power_ratio * 100)
         
         if bar_height > 0:
-            glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surface, (*COLOR_PLUNGER, 80),
+            bbox = self._glow_begin(568, 750 - bar_height, 24, bar_height + 4)
+            pygame.draw.rect(self._glow_surface, (*COLOR_PLUNGER, 80),
                            (568, 750 - bar_height, 24, bar_height + 4))
-            self.screen.blit(glow_surface, (0, 0))
-            
+            self._glow_end(bbox)
+
             pygame.draw.rect(self.screen, COLOR_PLUNGER,
                            (570, 750 - bar_height, 20, bar_height))
-        
-        pygame.draw.rect(self.screen, COLOR_TEXT, (570, 650, 20, 100), 2)
     
     def _draw_flippers(self, table: PinballTable):
-        current_time = pygame.time.get_ticks() / 1000.0
+        current_time = self._now
         
         flipper_data = [
-            (table.right_flipper_body.position, table.right_flipper_body.angle, 
-             [(15, -10), (-80, 0), (15, 10)], table.right_flipper_shape),
+            (table.right_flipper_body.position, table.right_flipper_body.angle,
+             self._flipper_rotations[0], table.right_flipper_shape),
             (table.left_flipper_body.position, table.left_flipper_body.angle,
-             [(-15, -10), (80, 0), (-15, 10)], table.left_flipper_shape),
+             self._flipper_rotations[1], table.left_flipper_shape),
             (table.mini_flipper_body.position, table.mini_flipper_body.angle,
-             [(8, -5), (-40, 0), (8, 5)], table.mini_flipper_shape),
+             self._flipper_rotations[2], table.mini_flipper_shape),
         ]
-        
-        for pos, angle, poly, shape in flipper_data:
-            cos_a, sin_a = math.cos(angle), math.sin(angle)
-            rotated_points = []
-            for x, y in poly:
-                rx = x * cos_a - y * sin_a + pos.x
-                ry = x * sin_a + y * cos_a + pos.y
-                rotated_points.append((rx, ry))
+
+        for pos, angle, rotations, shape in flipper_data:
+            bucket = int(angle * (256 / (2 * math.pi))) & 255
+            rotated_points = [(ox + pos.x, oy + pos.y) for ox, oy in rotations[bucket]]
             
-            hit_time = self.flipper_hit_times.get(id(shape), 0)
+            hit_time = self.flipper_hit_times[shape._rkey]
             time_since_hit = current_time - hit_time
             
             if time_since_hit < 0.15:
@@ -990,225 +1293,252 @@ class Renderer:
                 glow_color = COLOR_FLIPPER
                 glow_intensity = 30
             
-            glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            xs = [p[0] for p in rotated_points]
+            ys = [p[1] for p in rotated_points]
+            bbox = self._glow_begin(min(xs) - 14, min(ys) - 14,
+                                    max(xs) - min(xs) + 28, max(ys) - min(ys) + 28)
             for i in range(3, 0, -1):
                 alpha = glow_intensity - i * 10
-                pygame.draw.polygon(glow_surface, (*glow_color, alpha), rotated_points, 
+                pygame.draw.polygon(self._glow_surface, (*glow_color, alpha), rotated_points,
                                   width=0 if i == 3 else i * 4)
-            self.screen.blit(glow_surface, (0, 0))
+            self._glow_end(bbox)
             
             pygame.draw.polygon(self.screen, flipper_color, rotated_points)
             pygame.draw.polygon(self.screen, (255, 255, 255), rotated_points, 2)
     
     def _draw_balls(self, table: PinballTable):
         """Draw balls with neon pink glow and trail effect."""
+        half = self._ball_glow.get_width() // 2
         for ball in table.balls:
             pos = ball.body.position
-            ball_id = id(ball.body)
-            
-            trail = self.ball_trails.get(ball_id, [])
+            if (pos.x < -half or pos.x > SCREEN_WIDTH + half
+                    or pos.y < -half or pos.y > SCREEN_HEIGHT + half):
+                continue
+
+            trail = list(ball.body._trail)
             if len(trail) > 1:
-                for i in range(len(trail) - 1):
-                    alpha = int(255 * (i / len(trail)) * 0.5)
-                    trail_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                    pygame.draw.line(trail_surface, (*COLOR_NEON_PINK, alpha), 
-                                   trail[i], trail[i + 1], 4)
-                    self.screen.blit(trail_surface, (0, 0))
-            
-            for i in range(4, 0, -1):
-                alpha = 40 - i * 10
-                glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surface, (*COLOR_NEON_PINK, alpha), 
-                                 (int(pos.x), int(pos.y)), BALL_RADIUS + i * 6)
-                self.screen.blit(glow_surface, (0, 0))
-            
-            pygame.draw.circle(self.screen, COLOR_NEON_PINK, (int(pos.x), int(pos.y)), BALL_RADIUS)
+                txs = [p[0] for p in trail]
+                tys = [p[1] for p in trail]
+                bbox = self._glow_begin(min(txs) - 4, min(tys) - 4,
+                                        max(txs) - min(txs) + 8, max(tys) - min(tys) + 8)
+                # Three polyline chunks approximate the old per-segment
+                # alpha gradient with 3 draw calls instead of 9.
+                n = len(trail)
+                bounds = (0, n // 3, 2 * n // 3, n - 1)
+                for chunk in range(3):
+                    a, b = bounds[chunk], bounds[chunk + 1]
+                    if b - a < 1:
+                        continue
+                    alpha = int(255 * 0.5 * (a + b) / (2 * n))
+                    pygame.draw.lines(self._glow_surface, (*COLOR_NEON_PINK, alpha),
+                                      False, trail[a:b + 1], 4)
+                self._glow_end(bbox)
             
-            highlight_pos = (int(pos.x - 3), int(pos.y - 3))
-            pygame.draw.circle(self.screen, (255, 150, 200), highlight_pos, 4)
+            self._blit_queue.append((self._ball_glow, (int(pos.x) - half, int(pos.y) - half)))
+        self._flush_blits()
     
     def _draw_particles(self):
         """Draw particle effects."""
-        for particle in self.particles:
-            alpha = int(255 * (particle['life'] / particle['max_life']))
-            particle_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, (*particle['color'], alpha), 
-                             (int(particle['x']), int(particle['y'])), particle['size'])
-            self.screen.blit(particle_surface, (0, 0))
+        for index in np.nonzero(self._p_life > 0)[0]:
+            x = int(self._p_x[index])
+            y = int(self._p_y[index])
+            # Drifted off-screen: skip the draw entirely rather than letting
+            # the clip machinery discard it later.
+            if not (0 <= x < SCREEN_WIDTH and 0 <= y < SCREEN_HEIGHT):
+                continue
+            alpha = int(255 * (self._p_life[index] / self._p_max_life[index]))
+            size = int(self._p_size[index])
+            bbox = self._glow_begin(x - size, y - size, size * 2, size * 2)
+            pygame.draw.circle(self._glow_surface, (*self._p_color[index], alpha), (x, y), size)
+            self._glow_end(bbox)
     
     def _spawn_particles(self, x, y, color, count=10):
-        """Spawn particle explosion at position."""
+        """Spawn particle explosion at position, reusing pooled slots."""
         for _ in range(count):
+            if not self._free_particles:
+                break
+            index = self._free_particles.pop()
             angle = random.random() * math.pi * 2
             speed = random.random() * 5 + 2
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': random.randint(20, 40),
-                'max_life': 40,
-                'size': random.randint(2, 5),
-                'color': color
-            })
+            self._p_x[index] = x
+            self._p_y[index] = y
+            self._p_vx[index] = math.cos(angle) * speed
+            self._p_vy[index] = math.sin(angle) * speed
+            self._p_life[index] = random.randint(20, 40)
+            self._p_size[index] = random.randint(2, 5)
+            self._p_color[index] = color
     
     def _draw_ball_saver(self, time_left):
         """Draw pulsing ball saver shield at drain."""
-        pulse = (math.sin(pygame.time.get_ticks() * 0.01) + 1) * 0.5
+        pulse = (math.sin(self._now * 10) + 1) * 0.5
         alpha = int(50 + pulse * 50)
         
         rect = pygame.Rect(50, 750, 450, 60)
-        glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.arc(glow_surface, (*COLOR_NEON_GREEN, alpha), rect, 0, math.pi, 20)
-        self.screen.blit(glow_surface, (0, 0))
-        
+        bbox = self._glow_begin(rect.x, rect.y, rect.width, rect.height)
+        pygame.draw.arc(self._glow_surface, (*COLOR_NEON_GREEN, alpha), rect, 0, math.pi, 20)
+        self._glow_end(bbox)
+
         saver_text = self.font.render(f"BALL SAVER: {time_left:.1f}s", True, COLOR_NEON_GREEN)
         text_rect = saver_text.get_rect(center=(SCREEN_WIDTH // 2, 770))
-        glow_surface2 = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surface2, (*COLOR_NEON_GREEN, alpha // 2), 
+        bbox = self._glow_begin(text_rect.x - 10, text_rect.y - 5,
+                                text_rect.width + 20, text_rect.height + 10)
+        pygame.draw.rect(self._glow_surface, (*COLOR_NEON_GREEN, alpha // 2),
                         (text_rect.x - 10, text_rect.y - 5, text_rect.width + 20, text_rect.height + 10))
-        self.screen.blit(glow_surface2, (0, 0))
+        self._glow_end(bbox)
         self.screen.blit(saver_text, text_rect)
     
     def _draw_ui(self, game_state: GameState):
-        score_text = self.font.render(f"SCORE: {game_state.score:,}", True, COLOR_NEON_CYAN)
-        balls_text = self.font.render(f"BALLS: {game_state.balls_remaining}", True, COLOR_NEON_PINK)
+        if game_state.score != self._score_cache[0]:
+            self._score_cache = (game_state.score,
+                                 self.font.render(f"SCORE: {game_state.score:,}", True, COLOR_NEON_CYAN))
+        score_text = self._score_cache[1]
+
+        if game_state.balls_remaining != self._balls_cache[0]:
+            self._balls_cache = (game_state.balls_remaining,
+                                 self.font.render(f"BALLS: {game_state.balls_remaining}", True, COLOR_NEON_PINK))
+        balls_text = self._balls_cache[1]
         
-        score_glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         score_rect = score_text.get_rect(topleft=(20, 10))
-        pygame.draw.rect(score_glow, (*COLOR_NEON_CYAN, 30), 
-                        (score_rect.x - 10, score_rect.y - 5, score_rect.width + 20, score_rect.height + 10))
-        self.screen.blit(score_glow, (0, 0))
+        bbox = self._glow_begin(score_rect.x - 10, score_rect.y - 5,
+                                score_rect.width + 20, score_rect.height + 10)
+        pygame.draw.rect(self._glow_surface, (*COLOR_NEON_CYAN, 30), bbox)
+        self._glow_end(bbox)
         self.screen.blit(score_text, score_rect)
-        
-        balls_glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+
         balls_rect = balls_text.get_rect(topright=(SCREEN_WIDTH - 20, 10))
-        pygame.draw.rect(balls_glow, (*COLOR_NEON_PINK, 30), 
-                        (balls_rect.x - 10, balls_rect.y - 5, balls_rect.width + 20, balls_rect.height + 10))
-        self.screen.blit(balls_glow, (0, 0))
+        bbox = self._glow_begin(balls_rect.x - 10, balls_rect.y - 5,
+                                balls_rect.width + 20, balls_rect.height + 10)
+        pygame.draw.rect(self._glow_surface, (*COLOR_NEON_PINK, 30), bbox)
+        self._glow_end(bbox)
         self.screen.blit(balls_text, balls_rect)
         
         difficulty_colors = {"EASY": COLOR_NEON_GREEN, "NORMAL": COLOR_PLUNGER, "HARD": COLOR_NEON_PINK}
         diff_color = difficulty_colors.get(self.difficulty.name, COLOR_TEXT)
-        diff_text = self.font.render(f"[{self.difficulty.name}]", True, diff_color)
+        if self.difficulty.name != self._diff_cache[0]:
+            self._diff_cache = (self.difficulty.name,
+                                self.font.render(f"[{self.difficulty.name}]", True, diff_color))
+        diff_text = self._diff_cache[1]
         diff_rect = diff_text.get_rect(midtop=(SCREEN_WIDTH // 2, 10))
-        
+
         if not game_state.ball_in_play and not game_state.game_over:
-            hint_text = self.font.render("D: Change Difficulty", True, (100, 100, 100))
-            hint_rect = hint_text.get_rect(midtop=(SCREEN_WIDTH // 2, 35))
-            self.screen.blit(hint_text, hint_rect)
+            hint_rect = self._hint_text.get_rect(midtop=(SCREEN_WIDTH // 2, 35))
+            self.screen.blit(self._hint_text, hint_rect)
         
-        diff_glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(diff_glow, (*diff_color, 30), 
-                        (diff_rect.x - 10, diff_rect.y - 5, diff_rect.width + 20, diff_rect.height + 10))
-        self.screen.blit(diff_glow, (0, 0))
+        bbox = self._glow_begin(diff_rect.x - 10, diff_rect.y - 5,
+                                diff_rect.width + 20, diff_rect.height + 10)
+        pygame.draw.rect(self._glow_surface, (*diff_color, 30), bbox)
+        self._glow_end(bbox)
         self.screen.blit(diff_text, diff_rect)
         
         if game_state.combo_multiplier > 1:
-            scale = self.combo_animation_scale
-            combo_text = self.big_font.render(f"x{game_state.combo_multiplier} COMBO!", True, COLOR_NEON_GREEN)
-            
-            scaled_size = (int(combo_text.get_width() * scale), int(combo_text.get_height() * scale))
-            combo_scaled = pygame.transform.scale(combo_text, scaled_size)
+            key = (game_state.combo_multiplier, self.combo_animation_scale > 1.25)
+            combo_scaled = self._combo_cache.get(key)
+            if combo_scaled is None:
+                combo_scaled = self.big_font.render(
+                    f"x{game_state.combo_multiplier} COMBO!", True, COLOR_NEON_GREEN)
+                if key[1]:
+                    combo_scaled = pygame.transform.scale(
+                        combo_scaled,
+                        (int(combo_scaled.get_width() * 1.5), int(combo_scaled.get_height() * 1.5)))
+                self._combo_cache[key] = combo_scaled
             
             combo_rect = combo_scaled.get_rect(center=(SCREEN_WIDTH // 2, 70))
-            combo_glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.rect(combo_glow, (*COLOR_NEON_GREEN, 40), 
-                            (combo_rect.x - 15, combo_rect.y - 10, combo_rect.width + 30, combo_rect.height + 20))
-            self.screen.blit(combo_glow, (0, 0))
+            bbox = self._glow_begin(combo_rect.x - 15, combo_rect.y - 10,
+                                    combo_rect.width + 30, combo_rect.height + 20)
+            pygame.draw.rect(self._glow_surface, (*COLOR_NEON_GREEN, 40), bbox)
+            self._glow_end(bbox)
             self.screen.blit(combo_scaled, combo_rect)
     
-    def _draw_plunger_indicator(self, power):
-        bar_height = int((power / self.difficulty.plunger_max_power) * 100)
-        
-        glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surface, (*COLOR_PLUNGER, 60), 
-                        (558, 750 - bar_height, 24, bar_height))
-        self.screen.blit(glow_surface, (0, 0))
-        
-        pygame.draw.rect(self.screen, COLOR_PLUNGER, 
-                        (560, 750 - bar_height, 20, bar_height))
-        pygame.draw.rect(self.screen, COLOR_TEXT,
-                        (560, 650, 20, 100), 2)
-    
-    def _draw_ball_saver_indicator(self, time_left):
-        """Draw ball saver status with neon glow."""
-        text = self.font.render(f"BALL SAVER: {time_left:.1f}s", True, COLOR_NEON_GREEN)
-        text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        
-        glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surface, (*COLOR_NEON_GREEN, 30), 
-                        (text_rect.x - 10, text_rect.y - 5, text_rect.width + 20, text_rect.height + 10))
-        self.screen.blit(glow_surface, (0, 0))
-        self.screen.blit(text, text_rect)
-    
     def _draw_game_over(self, game_state: GameState, high_score_board: 'HighScoreBoard'):
-        """Draw game over screen with neon styling."""
+        """Draw game over screen with neon styling (cached while unchanged)."""
+        key = (game_state.score, game_state.player_name, game_state.asking_for_name,
+               game_state.name_submitted,
+               tuple((entry['name'], entry['score']) for entry in high_score_board.scores[:5]),
+               len(high_score_board.scores))
+        if key != self._gameover_cache[0]:
+            overlay, cursor_pos = self._render_game_over(game_state, high_score_board)
+            self._gameover_cache = (key, overlay, cursor_pos)
+
+        self.screen.blit(self._gameover_cache[1], (0, 0))
+
+        cursor_pos = self._gameover_cache[2]
+        if cursor_pos is not None and (_get_ticks() // 500) % 2 == 0:
+            if self._cursor_text is None:
+                self._cursor_text = self.big_font.render("|", True, COLOR_NEON_CYAN)
+            self.screen.blit(self._cursor_text, cursor_pos)
+
+    def _render_game_over(self, game_state: GameState, high_score_board: 'HighScoreBoard'):
+        """Composite the full game-over overlay into a surface.
+
+        Returns (overlay, cursor_pos); cursor_pos is None unless the name
+        prompt is showing.
+        """
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 220))
-        self.screen.blit(overlay, (0, 0))
-        
+        cursor_pos = None
+
+        def glow_rect(color, alpha, rect):
+            glow = pygame.Surface((rect[2], rect[3]), pygame.SRCALPHA)
+            glow.fill((*color, alpha))
+            overlay.blit(glow, (rect[0], rect[1]))
+
         final_score = game_state.score
-        
+
         game_over_text = self.big_font.render("GAME OVER", True, COLOR_NEON_PINK)
         go_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        go_glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(go_glow, (*COLOR_NEON_PINK, 40),
-                        (go_rect.x - 20, go_rect.y - 15, go_rect.width + 40, go_rect.height + 30))
-        self.screen.blit(go_glow, (0, 0))
-        self.screen.blit(game_over_text, go_rect)
-        
+        glow_rect(COLOR_NEON_PINK, 40,
+                  (go_rect.x - 20, go_rect.y - 15, go_rect.width + 40, go_rect.height + 30))
+        overlay.blit(game_over_text, go_rect)
+
         score_text = self.font.render(f"YOUR SCORE: {final_score:,}", True, COLOR_NEON_CYAN)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 140))
-        self.screen.blit(score_text, score_rect)
-        
+        overlay.blit(score_text, score_rect)
+
         if game_state.asking_for_name:
             prompt_text = self.font.render("NEW HIGH SCORE! Enter name:", True, COLOR_NEON_GREEN)
             prompt_rect = prompt_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
-            self.screen.blit(prompt_text, prompt_rect)
-            
-            cursor_blink = (pygame.time.get_ticks() // 500) % 2 == 0
-            name_display = game_state.player_name + ("|" if cursor_blink else "")
-            name_text = self.big_font.render(name_display, True, COLOR_NEON_CYAN)
+            overlay.blit(prompt_text, prompt_rect)
+
+            name_text = self.big_font.render(game_state.player_name, True, COLOR_NEON_CYAN)
             name_rect = name_text.get_rect(center=(SCREEN_WIDTH // 2, 260))
-            
-            name_glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.rect(name_glow, (*COLOR_NEON_CYAN, 50),
-                           (SCREEN_WIDTH // 2 - 150, 230, 300, 60))
-            self.screen.blit(name_glow, (0, 0))
-            pygame.draw.rect(self.screen, COLOR_NEON_CYAN,
+
+            glow_rect(COLOR_NEON_CYAN, 50, (SCREEN_WIDTH // 2 - 150, 230, 300, 60))
+            pygame.draw.rect(overlay, COLOR_NEON_CYAN,
                            (SCREEN_WIDTH // 2 - 150, 230, 300, 60), 2)
-            self.screen.blit(name_text, name_rect)
-            
+            overlay.blit(name_text, name_rect)
+            cursor_pos = (name_rect.right + 2, name_rect.top)
+
             hint_text = self.font.render("Press ENTER to submit", True, COLOR_TEXT)
             hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, 310))
-            self.screen.blit(hint_text, hint_rect)
+            overlay.blit(hint_text, hint_rect)
             start_y = 360
         else:
             if high_score_board.is_high_score(final_score) and not game_state.name_submitted:
                 prompt_text = self.font.render("Record your score? (Y/N)", True, COLOR_NEON_GREEN)
                 prompt_rect = prompt_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
-                self.screen.blit(prompt_text, prompt_rect)
+                overlay.blit(prompt_text, prompt_rect)
             start_y = 250
-        
+
         board_title = self.font.render("=== HIGH SCORES ===", True, COLOR_PLUNGER)
         board_rect = board_title.get_rect(center=(SCREEN_WIDTH // 2, start_y))
-        self.screen.blit(board_title, board_rect)
-        
+        overlay.blit(board_title, board_rect)
+
         for i, entry in enumerate(high_score_board.scores[:5]):
             rank_color = COLOR_NEON_PINK if i == 0 else (COLOR_NEON_CYAN if i < 3 else COLOR_TEXT)
             entry_text = self.font.render(f"{i+1}. {entry['name'][:10]:10s} {entry['score']:,}", True, rank_color)
             entry_rect = entry_text.get_rect(center=(SCREEN_WIDTH // 2, start_y + 40 + i * 35))
-            self.screen.blit(entry_text, entry_rect)
-        
+            overlay.blit(entry_text, entry_rect)
+
         if len(high_score_board.scores) == 0:
             no_scores = self.font.render("No records yet!", True, COLOR_TEXT)
             no_rect = no_scores.get_rect(center=(SCREEN_WIDTH // 2, start_y + 60))
-            self.screen.blit(no_scores, no_rect)
-        
+            overlay.blit(no_scores, no_rect)
+
         restart_text = self.font.render("Press R to restart", True, COLOR_TEXT)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, 750))
-        self.screen.blit(restart_text, restart_rect)
+        overlay.blit(restart_text, restart_rect)
+
+        return overlay, cursor_pos
 
 
 # =============================================================================
@@ -1351,10 +1681,24 @@ class PinballGame:
                 self.game_state.plunger_power = 0
                 self.game_state.plunger_direction = 1
         
+        self.table.current_time = _get_ticks() * 0.001
         self.table.update(dt)
-        
-        sub_dt = dt / PHYSICS_SUBSTEPS
-        for _ in range(PHYSICS_SUBSTEPS):
+
+        # Adaptive substepping: most frames the ball is slow and 2 substeps
+        # are plenty; only fast shots pay for the full 5.
+        max_speed_sqrd = 0.0
+        for ball in self.table.balls:
+            vx, vy = ball.body.velocity
+            speed_sqrd = vx * vx + vy * vy
+            if speed_sqrd > max_speed_sqrd:
+                max_speed_sqrd = speed_sqrd
+        if max_speed_sqrd < PHYSICS_FAST_BALL_SPEED * PHYSICS_FAST_BALL_SPEED:
+            substeps = PHYSICS_MIN_SUBSTEPS
+        else:
+            substeps = PHYSICS_SUBSTEPS
+
+        sub_dt = dt / substeps
+        for _ in range(substeps):
             self.space.step(sub_dt)
     
     def draw(self):